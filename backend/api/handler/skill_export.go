@@ -150,8 +150,17 @@ func buildSkillZip(ctx context.Context, group *model.MCPServiceGroup, user *mode
 		return nil, err
 	}
 
-	// 6. Generate requirements.txt (pyyaml is optional, for YAML output in refresh_tool_docs.py)
-	if err := addFileToZip(zipWriter, "requirements.txt", "# Optional: for YAML output in refresh_tool_docs.py\n# pyyaml>=6.0\n"); err != nil {
+	// 6. Copy mcp_client.py (shared by executor.py and refresh_tool_docs.py)
+	mcpClientPy, err := templates.SkillTemplates.ReadFile("skill/mcp_client.py")
+	if err != nil {
+		return nil, fmt.Errorf("failed to read mcp_client.py template: %w", err)
+	}
+	if err := addFileToZip(zipWriter, "mcp_client.py", string(mcpClientPy)); err != nil {
+		return nil, err
+	}
+
+	// 7. Generate requirements.txt (pyyaml and orjson are optional)
+	if err := addFileToZip(zipWriter, "requirements.txt", "# Optional: for YAML output in refresh_tool_docs.py\n# pyyaml>=6.0\n# Optional: faster JSON request encoding\n# orjson>=3.0\n"); err != nil {
 		return nil, err
 	}
 
@@ -288,6 +297,7 @@ func generateSkillMD(group *model.MCPServiceGroup, services []skillServiceWithTo
 	sb.WriteString("```bash\n")
 	sb.WriteString("python executor.py <service-name> <tool-name> '<json-params>'\n")
 	sb.WriteString("```\n\n")
+	sb.WriteString("For many calls in a row, optionally start `python executor.py --serve &` first; later calls reuse its warm sessions.\n\n")
 
 	// Generate one real example from first tool with params
 	sb.WriteString("### Example\n\n")
@@ -307,7 +317,7 @@ doneExample:
 	sb.WriteString("## Refresh Tool Docs\n\n")
 	sb.WriteString("If the MCP tools change, refresh the docs:\n\n")
 	sb.WriteString("```bash\n")
-	sb.WriteString("python refresh_tool_docs.py\n")
+	sb.WriteString("python refresh_tool_docs.py --force\n")
 	sb.WriteString("```\n")
 
 	return sb.String()
@@ -4,93 +4,209 @@ MCP Tool Executor - Zero-token execution script
 
 Usage:
     python executor.py <mcp_name> <tool_name> <json_params>
+    python executor.py --serve [socket_path]
 
 Example:
     python executor.py github-mcp create_issue '{"repo": "owner/repo", "title": "Test"}'
+
+Daemon mode (optional, POSIX only):
+    `--serve` keeps warm, already-initialized MCP sessions behind a Unix
+    socket (default: .executor.sock next to this script, or
+    $MCP_EXECUTOR_SOCKET). While it is running, regular invocations forward
+    their call to it instead of opening a new session. Sessions idle for
+    more than 5 minutes are closed.
+
+Note: Uses Python standard library only; orjson is used to encode requests
+      when installed.
 """
 
 import sys
 import json
 import os
-import urllib.request
-import urllib.error
+import socket
+import threading
+import time
+
+from mcp_client import MCPClient, dumps, loads
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.environ.get("MCP_EXECUTOR_SOCKET", os.path.join(SCRIPT_DIR, '.executor.sock'))
+IDLE_SECONDS = 300
+# Daemon calls are bounded so a hung upstream cannot pin a pooled client
+CALL_TIMEOUT_SECONDS = 300
+
+
+# Parsed mcp-config.json keyed by (path, mtime), so the daemon only
+# re-reads the file after it changes
+_CFG_CACHE = {}
 
 
 def load_config():
     config_path = os.path.join(SCRIPT_DIR, 'mcp-config.json')
-    with open(config_path) as f:
-        return json.load(f)
+    key = (config_path, os.stat(config_path).st_mtime_ns)
+    config = _CFG_CACHE.get(key)
+    if config is None:
+        with open(config_path, 'rb') as f:
+            config = loads(f.read())
+        _CFG_CACHE.clear()
+        _CFG_CACHE[key] = config
+    return config
 
 
-class MCPClient:
-    """Simple MCP client that handles session management using standard library."""
+class PooledClient:
+    """An MCPClient kept warm by the daemon, used by one call at a time."""
     
-    def __init__(self, base_url):
-        self.base_url = base_url
-        self.session_id = None
+    def __init__(self, client):
+        self.client = client
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+
+
+class ClientPool:
+    """Keeps one initialized MCPClient per MCP server and closes idle ones."""
     
-    def _post(self, data, headers=None):
-        """Make a POST request using urllib."""
-        req_headers = {"Content-Type": "application/json"}
-        if headers:
-            req_headers.update(headers)
-        
-        request = urllib.request.Request(
-            self.base_url,
-            data=json.dumps(data).encode('utf-8'),
-            headers=req_headers,
-            method='POST'
-        )
-        
-        with urllib.request.urlopen(request) as response:
-            response_headers = dict(response.headers)
-            body = json.loads(response.read().decode('utf-8'))
-            return body, response_headers
+    def __init__(self, idle_seconds=IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self._clients = {}
+        self._lock = threading.Lock()
     
-    def initialize(self):
-        """Initialize MCP session and get session ID."""
-        body, headers = self._post({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "mcp-executor",
-                    "version": "1.0.0"
-                }
-            }
-        })
-        
-        self.session_id = headers.get("Mcp-Session-Id")
-        if not self.session_id:
-            raise Exception("No session ID in response")
-        
-        return body
+    def _get(self, mcp_name):
+        mcp_url = load_config()["mcpServers"][mcp_name]["url"]
+        with self._lock:
+            pooled = self._clients.get(mcp_name)
+            if pooled is None or pooled.client.base_url != mcp_url:
+                pooled = PooledClient(MCPClient(
+                    mcp_url, client_name="mcp-executor", timeout=CALL_TIMEOUT_SECONDS
+                ))
+                self._clients[mcp_name] = pooled
+            return pooled
     
-    def call_tool(self, tool_name, params):
-        """Call a tool on the MCP server."""
-        if not self.session_id:
-            self.initialize()
-        
-        body, _ = self._post({
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": params
-            }
-        }, headers={"Mcp-Session-Id": self.session_id})
+    def _discard(self, mcp_name, pooled):
+        with self._lock:
+            if self._clients.get(mcp_name) is pooled:
+                del self._clients[mcp_name]
+        pooled.client.close()
+    
+    def call_tool(self, mcp_name, tool_name, params):
+        pooled = self._get(mcp_name)
+        if not pooled.lock.acquire(blocking=False):
+            # The warm client is busy; use a one-off client rather than
+            # queueing behind a call that may be slow or hung
+            client = MCPClient(
+                pooled.client.base_url, client_name="mcp-executor", timeout=CALL_TIMEOUT_SECONDS
+            )
+            try:
+                return client.call_tool(tool_name, params)
+            finally:
+                client.close()
         
-        return body
+        try:
+            pooled.last_used = time.monotonic()
+            return pooled.client.call_tool(tool_name, params)
+        except Exception:
+            # Start a fresh session on the next call
+            self._discard(mcp_name, pooled)
+            raise
+        finally:
+            pooled.last_used = time.monotonic()
+            pooled.lock.release()
+    
+    def evict_idle(self):
+        """Close clients idle for longer than idle_seconds, skipping busy ones."""
+        deadline = time.monotonic() - self.idle_seconds
+        with self._lock:
+            idle = [(name, pooled) for name, pooled in self._clients.items()
+                    if pooled.last_used < deadline]
+        for name, pooled in idle:
+            if pooled.lock.acquire(blocking=False):
+                try:
+                    self._discard(name, pooled)
+                finally:
+                    pooled.lock.release()
+    
+    def run_evictor(self):
+        while True:
+            time.sleep(min(60, self.idle_seconds))
+            self.evict_idle()
+
+
+def serve(socket_path):
+    """Run the executor daemon on a Unix socket until interrupted."""
+    import socketserver
+    
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                request = loads(self.rfile.readline())
+                result = pool.call_tool(request["mcp"], request["tool"], request["params"])
+                reply = {"result": result}
+            except Exception as e:
+                reply = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(dumps(reply) + b"\n")
+    
+    pool = ClientPool()
+    threading.Thread(target=pool.run_evictor, daemon=True).start()
+    
+    if os.path.exists(socket_path):
+        sock = connect_daemon(socket_path)
+        if sock is not None:
+            sock.close()
+            print(f"An executor daemon is already serving on {socket_path}", file=sys.stderr)
+            sys.exit(1)
+        # Nothing is listening; remove the stale socket left by a previous daemon
+        os.unlink(socket_path)
+    
+    server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    server.daemon_threads = True
+    print(f"Serving on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+
+
+def connect_daemon(socket_path):
+    """Connect to a daemon socket. Returns None if nothing is listening."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def call_via_daemon(socket_path, mcp_name, tool_name, params):
+    """Forward a call to a running daemon. Returns None if none is listening."""
+    sock = connect_daemon(socket_path)
+    if sock is None:
+        return None
+    
+    with sock, sock.makefile("rwb") as f:
+        f.write(dumps({"mcp": mcp_name, "tool": tool_name, "params": params}) + b"\n")
+        f.flush()
+        line = f.readline()
+    
+    # The daemon accepted the request but died before replying. The tool may
+    # already have run upstream, so report it rather than re-running it.
+    if not line.strip():
+        return {"error": "daemon closed the connection without replying; "
+                         "the call may or may not have run"}
+    return loads(line)
 
 
 if __name__ == "__main__":
+    if len(sys.argv) in (2, 3) and sys.argv[1] == "--serve":
+        serve(sys.argv[2] if len(sys.argv) == 3 else SOCKET_PATH)
+        sys.exit(0)
+    
     if len(sys.argv) != 4:
         print(__doc__)
         sys.exit(1)
@@ -99,9 +215,19 @@ if __name__ == "__main__":
     tool_name = sys.argv[2]
     params = json.loads(sys.argv[3])
 
-    config = load_config()
-    mcp_url = config["mcpServers"][mcp_name]["url"]
+    reply = call_via_daemon(SOCKET_PATH, mcp_name, tool_name, params)
+    if reply is not None:
+        if "error" in reply:
+            print(f"Error: {reply['error']}", file=sys.stderr)
+            sys.exit(1)
+        result = reply["result"]
+    else:
+        config = load_config()
+        mcp_url = config["mcpServers"][mcp_name]["url"]
 
-    client = MCPClient(mcp_url)
-    result = client.call_tool(tool_name, params)
+        client = MCPClient(mcp_url, client_name="mcp-executor")
+        try:
+            result = client.call_tool(tool_name, params)
+        finally:
+            client.close()
     print(json.dumps(result, indent=2))
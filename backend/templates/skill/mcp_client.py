@@ -0,0 +1,222 @@
+"""
+Minimal MCP client shared by executor.py and refresh_tool_docs.py.
+
+Note: Uses Python standard library only; orjson is used to encode requests
+      when installed.
+"""
+
+import base64
+import itertools
+import json
+import ssl
+import zlib
+import http.client
+import urllib.parse
+import urllib.request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj):
+    """Serialize obj to JSON bytes, using orjson when it can encode the value."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits and lone surrogates;
+            # the stdlib encoder handles both (JSONEncodeError is a TypeError)
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
+# Responses are parsed with the stdlib: orjson turns integers beyond 64
+# bits into floats and rejects lone-surrogate escapes that json accepts
+loads = json.loads
+
+
+_SSL_CONTEXT = None
+
+
+def _ssl_context():
+    """Return the process-wide SSL context, creating it on first use.
+    
+    Building a context loads the CA store, so plain-HTTP runs skip it.
+    """
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
+
+
+class MCPClient:
+    """Simple MCP client that handles session management using standard library."""
+    
+    # Daemons may hold many clients; slots keep each instance small
+    __slots__ = (
+        'base_url', 'session_id', '_path', '_conn', '_proxy_headers',
+        '_initialize_body', '_ids',
+    )
+    
+    # The initialize envelope only varies by client name, so it is
+    # serialized once per client
+    INITIALIZE_TEMPLATE = (
+        b'{"jsonrpc":"2.0","id":1,"method":"initialize","params":{'
+        b'"protocolVersion":"2024-11-05","capabilities":{},'
+        b'"clientInfo":{"name":%b,"version":"1.0.0"}}}'
+    )
+    # Only the request id, tool name and arguments are serialized per call
+    CALL_TOOL_TEMPLATE = (
+        b'{"jsonrpc":"2.0","id":%d,"method":"tools/call",'
+        b'"params":{"name":%b,"arguments":%b}}'
+    )
+    LIST_TOOLS_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"tools/list","params":{}}'
+    
+    def __init__(self, base_url, client_name="one-mcp-skill", timeout=None):
+        self.base_url = base_url
+        self.session_id = None
+        self._initialize_body = self.INITIALIZE_TEMPLATE % dumps(client_name)
+        # MCP forbids reusing a request id within a session, and a pooled
+        # client keeps its session across many calls (id 1 is initialize)
+        self._ids = itertools.count(2)
+        
+        # Keep one keep-alive connection per client so initialize and the
+        # follow-up call share the same TCP/TLS session.
+        url = urllib.parse.urlsplit(base_url)
+        self._path = url.path or "/"
+        if url.query:
+            self._path += "?" + url.query
+        self._proxy_headers = {}
+        
+        # Honor HTTP_PROXY/HTTPS_PROXY/NO_PROXY the same way urllib does
+        proxy = urllib.request.getproxies().get(url.scheme)
+        if proxy and urllib.request.proxy_bypass(url.netloc):
+            proxy = None
+        
+        if not proxy:
+            if url.scheme == "https":
+                self._conn = http.client.HTTPSConnection(
+                    url.netloc, timeout=timeout, context=_ssl_context()
+                )
+            else:
+                self._conn = http.client.HTTPConnection(url.netloc, timeout=timeout)
+            return
+        
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+        proxy_url = urllib.parse.urlsplit(proxy)
+        proxy_headers = {}
+        if proxy_url.username:
+            user = urllib.parse.unquote(proxy_url.username)
+            password = urllib.parse.unquote(proxy_url.password or "")
+            token = base64.b64encode(f"{user}:{password}".encode()).decode("ascii")
+            proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+        
+        if url.scheme == "https":
+            # CONNECT through the proxy, then TLS end-to-end with the server
+            self._conn = http.client.HTTPSConnection(
+                proxy_url.hostname, proxy_url.port or 80,
+                timeout=timeout, context=_ssl_context()
+            )
+            self._conn.set_tunnel(url.hostname, url.port, headers=proxy_headers)
+        else:
+            # Plain HTTP proxies take the absolute URL as the request target
+            self._conn = http.client.HTTPConnection(
+                proxy_url.hostname, proxy_url.port or 80, timeout=timeout
+            )
+            self._path = urllib.parse.urlunsplit(url._replace(fragment=""))
+            self._proxy_headers = proxy_headers
+    
+    def close(self):
+        """Close the underlying connection."""
+        self._conn.close()
+    
+    def _send(self, body, headers=None):
+        """POST an encoded JSON body over the persistent connection."""
+        req_headers = {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
+        req_headers.update(self._proxy_headers)
+        if headers:
+            req_headers.update(headers)
+        
+        reused = self._conn.sock is not None
+        try:
+            self._conn.request("POST", self._path, body=body, headers=req_headers)
+            response = self._conn.getresponse()
+        except ConnectionError:
+            # The server closed the idle keep-alive connection; reconnect once.
+            # Fresh connections are not retried so requests are never resent
+            # after a genuine failure.
+            self._conn.close()
+            if not reused:
+                raise
+            self._conn.request("POST", self._path, body=body, headers=req_headers)
+            response = self._conn.getresponse()
+        
+        # Always drain the body so the connection can be reused
+        raw = response.read()
+        # Only gzip is advertised: "deflate" is ambiguous in practice (raw vs
+        # zlib-wrapped), and gzip is what servers send anyway
+        if response.headers.get("Content-Encoding", "").lower() == "gzip":
+            raw = zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+        return response, raw
+    
+    def _post(self, body, headers=None):
+        """Make a POST request and decode the JSON response."""
+        return self._decode(*self._send(body, headers))
+    
+    def _decode(self, response, raw):
+        """Raise for redirect/error statuses, otherwise parse the JSON body."""
+        if 300 <= response.status < 400:
+            location = response.headers.get("Location", "unknown location")
+            raise Exception(
+                f"HTTP {response.status}: redirected to {location}; "
+                "update the server URL in mcp-config.json"
+            )
+        if response.status >= 400:
+            raise Exception(f"HTTP {response.status}: {response.reason}")
+        
+        # response.headers supports case-insensitive .get(); no need to copy it
+        return loads(raw), response.headers
+    
+    def initialize(self):
+        """Initialize MCP session and get session ID."""
+        body, headers = self._post(self._initialize_body)
+        
+        self.session_id = headers.get("Mcp-Session-Id")
+        if not self.session_id:
+            raise Exception("No session ID in response")
+        
+        return body
+    
+    def _request(self, message):
+        """Send an encoded request, initializing the session first if needed."""
+        reused = self.session_id is not None
+        if not reused:
+            self.initialize()
+        
+        response, raw = self._send(message, headers={"Mcp-Session-Id": self.session_id})
+        if response.status == 404 and reused:
+            # MCP answers 404 for an expired session: re-initialize and retry
+            # once. The server did not run the request, so resending is safe.
+            self.session_id = None
+            self.initialize()
+            response, raw = self._send(message, headers={"Mcp-Session-Id": self.session_id})
+        
+        body, _ = self._decode(response, raw)
+        return body
+    
+    def call_tool(self, tool_name, params):
+        """Call a tool on the MCP server."""
+        body = self.CALL_TOOL_TEMPLATE % (next(self._ids), dumps(tool_name), dumps(params))
+        return self._request(body)
+    
+    def list_tools(self):
+        """List all available tools."""
+        body = self._request(self.LIST_TOOLS_TEMPLATE % next(self._ids))
+        
+        if "error" in body:
+            raise Exception(f"MCP error: {body['error']}")
+        
+        return body.get("result", {}).get("tools", [])
@@ -3,26 +3,37 @@
 Refresh MCP tool documentation for all configured servers.
 
 Usage:
-    python refresh_tool_docs.py
+    python refresh_tool_docs.py [--force]
+
+Tool lists are cached in .tool_cache.json for MCP_DOCS_TTL seconds
+(default 3600). Pass --force to bypass the cache.
 
 Note: Uses Python standard library only (no external dependencies).
       For YAML output, install pyyaml: pip install pyyaml
+      For faster request encoding, install orjson: pip install orjson
 """
 
+import io
 import json
 import os
-import urllib.request
-import urllib.error
-from pathlib import Path
+import sys
+import time
 
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+# Heavier modules (mcp_client, pyyaml, concurrent.futures, pathlib) are
+# imported where they are used so that importing this script stays cheap.
+_yaml = None
+_YAML_DUMP_KWARGS = None
+_render_params = None
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(SCRIPT_DIR, '.tool_cache.json')
+try:
+    CACHE_TTL_SECONDS = int(os.environ.get("MCP_DOCS_TTL", "3600"))
+except ValueError:
+    CACHE_TTL_SECONDS = 3600
+# Per-request socket timeout so one unresponsive server cannot stall the refresh
+REQUEST_TIMEOUT_SECONDS = 30
 
 
 def load_config():
@@ -31,91 +42,68 @@ def load_config():
         return json.load(f)
 
 
-class MCPClient:
-    """Simple MCP client that handles session management using standard library."""
+def load_cache():
+    try:
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _discard(path):
+    """Remove a leftover temp file, ignoring it if already gone."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def save_cache(cache):
+    # Same temp file + os.replace pattern as the docs, so concurrent
+    # refreshes never leave a half-written cache behind
+    tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
+def fetch_tools(server, cache, force=False):
+    """Fetch tools from MCP server, reusing the cached list while it is fresh."""
+    # Read the URL here so a malformed entry fails only this server's future
+    mcp_url = server["url"]
+    entry = cache.get(mcp_url)
+    if not force and entry and time.time() - entry["fetched_at"] < CACHE_TTL_SECONDS:
+        return entry["tools"]
     
-    def __init__(self, base_url):
-        self.base_url = base_url
-        self.session_id = None
+    from mcp_client import MCPClient
     
-    def _post(self, data, headers=None):
-        """Make a POST request using urllib."""
-        req_headers = {"Content-Type": "application/json"}
-        if headers:
-            req_headers.update(headers)
-        
-        request = urllib.request.Request(
-            self.base_url,
-            data=json.dumps(data).encode('utf-8'),
-            headers=req_headers,
-            method='POST'
-        )
-        
-        with urllib.request.urlopen(request) as response:
-            response_headers = dict(response.headers)
-            body = json.loads(response.read().decode('utf-8'))
-            return body, response_headers
+    client = MCPClient(mcp_url, client_name="refresh-tool-docs", timeout=REQUEST_TIMEOUT_SECONDS)
+    try:
+        tools = client.list_tools()
+    finally:
+        client.close()
     
-    def initialize(self):
-        """Initialize MCP session and get session ID."""
-        body, headers = self._post({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "refresh-tool-docs",
-                    "version": "1.0.0"
-                }
-            }
-        })
-        
-        self.session_id = headers.get("Mcp-Session-Id")
-        if not self.session_id:
-            raise Exception("No session ID in response")
-        
-        return body
-    
-    def list_tools(self):
-        """List all available tools."""
-        if not self.session_id:
-            self.initialize()
-        
-        body, _ = self._post({
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list",
-            "params": {}
-        }, headers={"Mcp-Session-Id": self.session_id})
-        
-        if "error" in body:
-            raise Exception(f"MCP error: {body['error']}")
-        
-        return body.get("result", {}).get("tools", [])
+    cache[mcp_url] = {"fetched_at": time.time(), "tools": tools}
+    return tools
 
 
-def fetch_tools(mcp_url):
-    """Fetch tools from MCP server using proper session management."""
-    client = MCPClient(mcp_url)
-    return client.list_tools()
+# (schema key, param key) pairs copied into the compact params when present
+OPTIONAL_PARAM_KEYS = (("description", "desc"), ("enum", "enum"), ("default", "default"))
 
 
 def convert_schema_to_yaml_params(input_schema):
     """Convert inputSchema to compact YAML format."""
     props = input_schema.get("properties", {})
-    required = set(input_schema.get("required", []))
+    required = set(input_schema.get("required", ()))
     
     params = {}
     for name, prop in props.items():
         param = {"type": prop.get("type", "string")}
-        if "description" in prop:
-            param["desc"] = prop["description"]
-        if "enum" in prop:
-            param["enum"] = prop["enum"]
-        if "default" in prop:
-            param["default"] = prop["default"]
+        param.update([(dst, prop[src]) for src, dst in OPTIONAL_PARAM_KEYS if src in prop])
         if name in required:
             param["required"] = True
         params[name] = param
@@ -123,44 +111,108 @@ def convert_schema_to_yaml_params(input_schema):
     return params
 
 
+def _render_yaml(input_schema):
+    params = convert_schema_to_yaml_params(input_schema)
+    return "```yaml\n" + _yaml.dump(params, **_YAML_DUMP_KWARGS).rstrip() + "\n```"
+
+
+def _render_json(input_schema):
+    return "```json\n" + json.dumps(input_schema, indent=2) + "\n```"
+
+
+def params_renderer():
+    """Resolve the params renderer once: YAML if pyyaml is installed, else JSON."""
+    global _render_params, _yaml, _YAML_DUMP_KWARGS
+    if _render_params is None:
+        try:
+            import yaml
+        except ImportError:
+            _render_params = _render_json
+        else:
+            _yaml = yaml
+            # Prefer the libyaml-backed dumper when available
+            _YAML_DUMP_KWARGS = {
+                "Dumper": getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                "allow_unicode": True,
+                "default_flow_style": False,
+            }
+            _render_params = _render_yaml
+    return _render_params
+
+
 def write_tools_md(mcp_name, tools, output_dir):
-    lines = [f"# {mcp_name} Tools", ""]
+    render_params = params_renderer()
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {mcp_name} Tools\n\n")
     
     for tool in tools:
-        lines.append(f"## {tool['name']}")
-        lines.append("")
+        w(f"## {tool['name']}\n\n")
         if tool.get("description"):
-            lines.append(tool["description"])
-            lines.append("")
+            w(f"{tool['description']}\n\n")
         
         input_schema = tool.get("inputSchema", {})
         if input_schema.get("properties"):
-            lines.append("**Params:**")
-            if HAS_YAML:
-                lines.append("```yaml")
-                params = convert_schema_to_yaml_params(input_schema)
-                lines.append(yaml.dump(params, allow_unicode=True, default_flow_style=False).rstrip())
-            else:
-                lines.append("```json")
-                lines.append(json.dumps(input_schema, indent=2))
-            lines.append("```")
-            lines.append("")
+            w(f"**Params:**\n{render_params(input_schema)}\n\n")
     
+    # Every fragment ends with a newline; drop the final one to keep the
+    # previous line-joined layout
+    data = buf.getvalue()[:-1].encode("utf-8")
+    
+    # Leave byte-identical docs untouched so their mtimes stay stable
     output_path = output_dir / f"{mcp_name}.md"
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    try:
+        unchanged = (output_path.stat().st_size == len(data)
+                     and output_path.read_bytes() == data)
+    except OSError:
+        unchanged = False
+    if unchanged:
+        print(f"Unchanged: {output_path}")
+        return
+    
+    # Write to a per-process sibling temp file and swap it in, so readers
+    # never see a partially written doc and concurrent refreshes never
+    # write into each other's temp file
+    tmp_path = output_dir / f"{mcp_name}.md.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
     print(f"Updated: {output_path}")
 
 
 if __name__ == "__main__":
+    if "-h" in sys.argv[1:] or "--help" in sys.argv[1:]:
+        print(__doc__)
+        sys.exit(0)
+    
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from pathlib import Path
+    
+    force = "--force" in sys.argv[1:]
     config = load_config()
+    cache = load_cache()
     tools_dir = Path(SCRIPT_DIR) / "tools"
     tools_dir.mkdir(exist_ok=True)
 
-    for mcp_name, server in config["mcpServers"].items():
-        try:
-            tools = fetch_tools(server["url"])
-            write_tools_md(mcp_name, tools, tools_dir)
-        except Exception as e:
-            print(f"Error fetching tools for {mcp_name}: {e}")
+    servers = config["mcpServers"]
+    if servers:
+        # Servers are independent, so fetch them concurrently and write the
+        # docs from the main thread as results come in.
+        with ThreadPoolExecutor(max_workers=min(32, len(servers))) as executor:
+            futures = {
+                executor.submit(fetch_tools, server, cache, force): mcp_name
+                for mcp_name, server in servers.items()
+            }
+            for future in as_completed(futures):
+                mcp_name = futures[future]
+                try:
+                    write_tools_md(mcp_name, future.result(), tools_dir)
+                except Exception as e:
+                    print(f"Error fetching tools for {mcp_name}: {e}")
+        save_cache(cache)
 
     print("Tool docs refreshed")